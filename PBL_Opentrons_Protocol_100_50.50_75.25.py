@@ -19,11 +19,75 @@ Overview:
 Note: Ensure the labware and pipettes are calibrated before running the protocol. This protocol requires 2 Opentrons temperature modules.
 """
 
+from itertools import groupby  # Required for grouping transfer chunks by source column
+
 from opentrons import protocol_api
 from opentrons.types import Point  # Required for position offsets
 
 metadata = {"apiLevel": "2.21"}
 
+# Temperature control - the GEN2 modules hold the block at the set point, TEMP_OFFSET is meant to cover the heat loss
+# between block and solution. The value below is an UNMEASURED placeholder - the original 80 °C set point was an
+# empirical correction, so measure the in-well temperature with a probe and update TEMP_OFFSET before relying on it
+SOLUTION_TEMPERATURE = 50  # Target temperature in the solutions (°C)
+TEMP_OFFSET = 3  # Block-to-solution correction (°C) - placeholder, not yet measured
+
+# Offsets for better mixing (in mm) - built once and shared by every offset mixing call
+OFFSETS = (Point(x=1, y=0, z=0), Point(x=-1, y=0, z=0), Point(x=0, y=1, z=0), Point(x=0, y=-1, z=0))
+
+# Transfer chunk plans - (source position, volume) pairs of at most 20 µL, keyed by the volume split (in µL)
+# Precomputed once and hand-tuned where needed (e.g., 25 µL as 15 + 10 instead of a poorly pipetting 5 µL chunk),
+# any other split falls back to plan_transfer's greedy 20 µL chunking
+TRANSFER_PLANS = {
+    (50, 50): [(0, 20), (0, 20), (0, 10), (1, 20), (1, 20), (1, 10)],
+    (75, 25): [(0, 20), (0, 20), (0, 20), (0, 15), (1, 15), (1, 10)],
+}
+
+def plan_transfer(source_volumes):
+    """
+    Return the (source position, volume) chunks for a volume split.
+    Uses the hand-tuned TRANSFER_PLANS entry if there is one, otherwise splits greedily into chunks of at most 20 µL.
+    Args:
+    source_volumes: List of total volumes to transfer from each source (in µL).
+    """
+    if tuple(source_volumes) in TRANSFER_PLANS:
+        return TRANSFER_PLANS[tuple(source_volumes)]
+
+    chunks = []
+    for position, source_volume in enumerate(source_volumes):
+        remaining = source_volume
+        while remaining > 0:
+            chunks.append((position, min(20, remaining)))
+            remaining -= min(20, remaining)
+    return chunks
+
+# Steps 1-6 as data - (source columns, destination column, source volumes) per mixture, ('REFILL', volume) for refills
+RECIPES = [
+    # STEP 1: Aspirate and dispense materials into 96-well aluminum block
+    ('REFILL', 160),
+
+    # STEP 2: Dispense mixtures into columns 4, 5, 6 of PLATE 1
+    ([0, 1], 3, [50, 50]),  # Column 4: 50-50 AB
+    ([0, 2], 4, [50, 50]),  # Column 5: 50-50 AC
+    ([1, 2], 5, [50, 50]),  # Column 6: 50-50 BC
+
+    # STEP 3: Refill Columns 1, 2, 3 of PLATE 1 to 160µL
+    ('REFILL', 100),
+
+    # STEP 4: Dispense mixtures into columns 7, 8, 9, 10 of Plate 1
+    ([0, 1], 6, [75, 25]),  # Column 7: 75-25 AB
+    ([0, 2], 7, [75, 25]),  # Column 8: 75-25 AC
+    ([1, 2], 8, [75, 25]),  # Column 9: 75-25 BC
+    ([2, 1], 9, [75, 25]),  # Column 10: 75-25 CB
+
+    # STEP 5: Refill Column 1 to 130µL and Columns 2, 3 to 155µL
+    ('REFILL', 120),
+
+    # STEP 6: Dispense mixtures into columns 11, 12 of Plate 1
+    ([2, 0], 10, [75, 25]),  # Column 11: 75-25 CA
+    ([1, 0], 11, [75, 25]),  # Column 12: 75-25 BA
+]
+
 def run(protocol: protocol_api.ProtocolContext):
 
 
@@ -32,9 +96,19 @@ def run(protocol: protocol_api.ProtocolContext):
     temp_module_4 = protocol.load_module('temperature module gen2', 4)
 
 
-    # Turn on the temperature modules to reach 50C in solutions - set it higher than 50 in order to reach target temperature in the solutions
-    temp_module_1.set_temperature(80)
-    temp_module_4.set_temperature(80)
+    # Turn on the temperature modules to reach 50C in solutions - the set point includes the block-to-solution offset
+    # Start both modules heating first, then wait for both - the two warm-ups run concurrently
+    module_temperature = SOLUTION_TEMPERATURE + TEMP_OFFSET
+    temp_module_1.start_set_temperature(module_temperature)
+    temp_module_4.start_set_temperature(module_temperature)
+    temp_module_1.await_temperature(module_temperature)
+    temp_module_4.await_temperature(module_temperature)
+
+    # Remind the operator that the block-to-solution offset has not been calibrated
+    protocol.comment(
+    f"Temperature modules set to {module_temperature} °C ({SOLUTION_TEMPERATURE} °C target + {TEMP_OFFSET} °C offset). \n"
+    f"Please check the in-well solution temperature with a probe - if it is not {SOLUTION_TEMPERATURE} °C, adjust TEMP_OFFSET."
+)
 
 
     # Custom reservoir in slot 4
@@ -49,20 +123,22 @@ def run(protocol: protocol_api.ProtocolContext):
     custom_microwell_slot2 = protocol.load_labware('custom_sample_holder', 2)
 
 
-    # Tip racks
+    # Cache column lists once - columns() rebuilds the full list of wells on every call
+    res_cols = custom_reservoir.columns()
+    ab_cols = aluminum_block_1.columns()
+    mw_cols = custom_microwell_slot2.columns()
+
+
+    # Tip racks - 4 racks are needed, 3 racks would run out partway through Step 12
     p20_tiprack_slot3 = protocol.load_labware('opentrons_96_filtertiprack_20ul', 3)
     p20_tiprack_slot5 = protocol.load_labware('opentrons_96_filtertiprack_20ul', 5)
     p20_tiprack_slot6 = protocol.load_labware('opentrons_96_filtertiprack_20ul', 6)
     p20_tiprack_slot8 = protocol.load_labware('opentrons_96_filtertiprack_20ul', 8)
-    p20_tiprack_slot9 = protocol.load_labware('opentrons_96_filtertiprack_20ul', 9)
 
 
     # Pipettes
-    p1000_single = protocol.load_instrument(
-        'p1000_single_gen2', 'left', tip_racks=None)
-
     p20_multi = protocol.load_instrument(
-        'p20_multi_gen2', 'right', tip_racks=[p20_tiprack_slot3, p20_tiprack_slot5, p20_tiprack_slot6, p20_tiprack_slot8, p20_tiprack_slot9])
+        'p20_multi_gen2', 'right', tip_racks=[p20_tiprack_slot3, p20_tiprack_slot5, p20_tiprack_slot6, p20_tiprack_slot8])
 
     # Slow Liquid Handling - high speed aspiration/dispensing may introduce air bubbles
     p20_multi.flow_rate.aspirate = 3  # Slow aspiration (default ~7.6 µL/s)
@@ -71,11 +147,27 @@ def run(protocol: protocol_api.ProtocolContext):
     # Blow-out Speed - control how fast pipette expels residual liquid from tip after dispensing
     p20_multi.flow_rate.blow_out = 5 # Reduce blow-out speed (default ~7.6 µL/s)
 
-    # Gantry Speed - reduce mechanical vibrations
-    p20_multi.default_speed = 100  # Set default speed for all movements (default ~400 mm/s)
+    # Gantry Speed - reduce mechanical vibrations only while the tip descends into the liquid, other travel runs at default speed
+    approach_speed = 100  # Descent speed from the well top into the liquid (default ~400 mm/s)
+
+    # Function for aspirating after a slow descent into the liquid
+    def slow_aspirate(pipette, volume, well):
+        """
+        Travel to the top of a well at default speed, then descend slowly and aspirate 1 mm above the bottom.
+        The plunger is prepared at the well top - otherwise aspirate() would lift out of the liquid to prepare it
+        and plunge back in at default speed.
+        Args:
+        pipette: The pipette object (e.g., p20_multi).
+        volume: Volume to aspirate (µL).
+        well: The well to aspirate from.
+        """
+        pipette.move_to(well.top())  # Default speed for the travel to the well
+        pipette.prepare_to_aspirate()  # Reset the plunger above the liquid
+        pipette.move_to(well.bottom(1), speed=approach_speed)  # Slow descent into the liquid
+        pipette.aspirate(volume, well.bottom(1))
 
     # Function for refilling columns 1, 2 and 3 of aluminum block with materials A, B and C
-    def refill_materials(pipette, reservoir_columns, dest_columns, volume_per_cycle, total_volume):
+    def refill_materials(pipette, reservoir_columns, dest_columns, volume_per_cycle, total_volume, keep_last_tip=False):
         """
         Transfer materials from reservoir columns to destination columns.
         Args:
@@ -84,17 +176,19 @@ def run(protocol: protocol_api.ProtocolContext):
         dest_columns: List of destination column indices.
         volume_per_cycle: Volume to aspirate/dispense in each cycle (µL).
         total_volume: Total volume to transfer to each destination column (µL).
+        keep_last_tip: Keep the tip used for the last destination column so the next operation can reuse it.
         """
         cycles = total_volume // volume_per_cycle  # Calculate full aspirate/dispense cycles
-        for source_idx, dest_idx in zip(reservoir_columns, dest_columns):
+        for i, (source_idx, dest_idx) in enumerate(zip(reservoir_columns, dest_columns)):
             pipette.pick_up_tip()
+            # One aspirate/dispense per cycle so every aspirate gets the slow descent - transfer() cannot slow each descent,
+            # and consolidate() would not save aspirates here since a single 20 µL cycle already fills the P20 tip
             for _ in range(cycles):
-                pipette.aspirate(volume_per_cycle, custom_reservoir.columns()[source_idx][0])
-                pipette.move_to(aluminum_block_1.columns()[dest_idx][0].top(30))
-                pipette.dispense(volume_per_cycle, aluminum_block_1.columns()[dest_idx][0])
-                pipette.blow_out(aluminum_block_1.columns()[dest_idx][0])
-                pipette.move_to(aluminum_block_1.columns()[dest_idx][0].top(30))
-            pipette.drop_tip()
+                slow_aspirate(pipette, volume_per_cycle, res_cols[source_idx][0])
+                pipette.dispense(volume_per_cycle, ab_cols[dest_idx][0])
+            pipette.blow_out(ab_cols[dest_idx][0])  # Blow out once after the final cycle only
+            if not (keep_last_tip and i == len(dest_columns) - 1):
+                pipette.drop_tip()
 
 
     # Function for offset mixing + position control with multi-channel P20 pipette
@@ -107,75 +201,71 @@ def run(protocol: protocol_api.ProtocolContext):
         mix_cycles: Number of mixing cycles.
         total_volume: Total volume to be mixed per cycle (in µL).
         """
-
-    # Define offsets for better mixing (in mm)
-        offsets = [Point(x=1, y=0, z=0), Point(x=-1, y=0, z=0), Point(x=0, y=1, z=0), Point(x=0, y=-1, z=0)]
         aspirate_volume = 20  # Maximum aspirate volume per step
         total_steps = total_volume // aspirate_volume # Number of steps per cycle (e.g., 80 µL = 4 steps of 20 µL)
 
         for cycle in range(mix_cycles):  # Perform multiple mixing cycles
-            for offset in offsets:  # Iterate through offsets for turbulence
-                for _ in range(total_steps):  # Repeat for the total mixing steps
-                    # Move near the bottom for aspiration with an offset
-                    pipette.move_to(location.bottom(1).move(offset))  # 1 mm above the bottom
-                    pipette.aspirate(aspirate_volume, location)
-
-                    # Move near the center for dispensing with an offset
-                    pipette.move_to(location.center().move(offset))  # Dispense at the center of the well
-                    pipette.dispense(aspirate_volume, location)
+            for offset in OFFSETS:  # Iterate through offsets for turbulence
+                # Prepare the plunger at the well top, descend slowly to the offset position 1 mm above the bottom,
+                # then batched mix in place for all mixing steps
+                pipette.move_to(location.top())  # Default speed for the travel to the well
+                pipette.prepare_to_aspirate()
+                pipette.move_to(location.bottom(1).move(offset), speed=approach_speed)
+                pipette.mix(total_steps, aspirate_volume)
     
     mixing_cycles = 1  # Perform 1 full offset cycle
 
-    def transfer_and_mix_once(pipette, source_columns, dest_column, source_volumes, mixing_cycles):
+    def transfer_and_mix_once(pipette, source_columns, dest_column, source_volumes, mixing_cycles, tip_attached=False):
         """
         Handles the transfer for a destination column using multiple source columns.
-        Ensures a tip change after each source column transfer and performs offset mixing at the destination
-        only after the final dispensing step.
+        Uses one tip per source column (a tip is never carried into a different source) and performs offset mixing
+        at the destination only after the final dispensing step.
         Args:
         pipette: The pipette object (e.g., p20_multi).
         source_columns: List of source column indices.
         dest_column: Destination column index.
-        volumes: List of total volumes to transfer from each source column (in µL).
+        source_volumes: List of total volumes to transfer from each source column (in µL).
         total_volume: Total volume to be mixed at the destination (in µL).
         mixing_cycles: Number of mixing cycles.
+        tip_attached: The pipette already holds a tip carrying only the first source material, so reuse it.
         """
        
     # Calculate the total mix volume dynamically
         total_mix_volume = sum(source_volumes)  # Total volume to be mixed in the destination column
 
-        for i, (source, source_volume) in enumerate(zip(source_columns, source_volumes)):  # Iterate through sources and volumes
-            pipette.pick_up_tip()  # Pick up a new tip for each source column
-            cycles = source_volume // 20  # Determine how many full 20 µL cycles are needed
-            remaining = source_volume % 20  # Calculate the remaining volume
+    # Look up the chunk plan and map source positions to source columns
+        chunks = [(source_columns[position], volume) for position, volume in plan_transfer(source_volumes)]
 
-        # Perform full 20 µL cycles
-            for _ in range(cycles):
-                pipette.aspirate(20, aluminum_block_1.columns()[source][0])
-                pipette.dispense(20, aluminum_block_1.columns()[dest_column][0])
-                pipette.blow_out(aluminum_block_1.columns()[dest_column][0])
+        groups = [(source, [volume for _, volume in group]) for source, group in groupby(chunks, key=lambda chunk: chunk[0])]
+
+        # Chunks from the same source are grouped, so tips are only changed when the source column changes
+        if not tip_attached:
+            pipette.pick_up_tip()
+        for i, (source, volumes) in enumerate(groups):  # Iterate through source groups
+            if i > 0:
+                pipette.drop_tip()
+                pipette.pick_up_tip()
 
-        # Handle any remaining volume
-            if remaining > 0:
-                pipette.aspirate(remaining, aluminum_block_1.columns()[source][0])
-                pipette.dispense(remaining, aluminum_block_1.columns()[dest_column][0])
-                pipette.blow_out(aluminum_block_1.columns()[dest_column][0])
+        # Transfer all chunks from this source with a slow descent before each aspirate, blowing out only after the last chunk
+            for volume in volumes:
+                slow_aspirate(pipette, volume, ab_cols[source][0])
+                pipette.dispense(volume, ab_cols[dest_column][0])
+            pipette.blow_out(ab_cols[dest_column][0])
 
         # Perform offset mixing ONLY after the last source column transfer
-            if i == len(source_columns) - 1:
-                offset_mixing_p20_multi(pipette=p20_multi, location=aluminum_block_1.columns()[dest_column][0], mix_cycles=mixing_cycles)
-            
-            pipette.move_to(aluminum_block_1.columns()[dest_column][0].top(30))
-            pipette.drop_tip()  # Drop the tip after finishing transfers (and mixing, if applicable)
+        offset_mixing_p20_multi(pipette=p20_multi, location=ab_cols[dest_column][0], mix_cycles=mixing_cycles)
+
+        pipette.drop_tip()  # Drop the tip after finishing transfers and mixing
 
-    def final_mixing_and_transfer(pipette, aluminum_block, microwell_holder, reservoir, di_water_column, column_range, mix_cycles, transfer_volume):
+    def final_mixing_and_transfer(pipette, aluminum_block_cols, microwell_holder_cols, reservoir_cols, di_water_column, column_range, mix_cycles, transfer_volume):
         """
         Final mixing in aluminum block, transfer of solution, and DI water addition into custom sample holder.
         Handles cases where the custom sample holder has a limited number of columns.
         Args:
         pipette: The pipette object (e.g., p20_multi).
-        aluminum_block: Aluminum block labware containing the source columns.
-        microwell_holder: Custom sample holder labware for the destination.
-        reservoir: Custom reservoir labware containing DI water.
+        aluminum_block_cols: Cached columns of the aluminum block containing the source columns.
+        microwell_holder_cols: Cached columns of the custom sample holder for the destination.
+        reservoir_cols: Cached columns of the custom reservoir containing DI water.
         di_water_column: Column index for DI water in the reservoir.
         column_range: Range of columns in the aluminum block to process (e.g., range(0, 4)).
         total_mix_volume: Total volume of the solution to be mixed (in µL).
@@ -188,77 +278,59 @@ def run(protocol: protocol_api.ProtocolContext):
         for col_idx, microwell_idx in zip(column_range, microwell_columns):
         # Step 1: Mix the solution in the aluminum block
             pipette.pick_up_tip()
-            offset_mixing_p20_multi(pipette=pipette, location=aluminum_block.columns()[col_idx][0], mix_cycles = mix_cycles)
+            offset_mixing_p20_multi(pipette=pipette, location=aluminum_block_cols[col_idx][0], mix_cycles = mix_cycles)
 
         # Step 2: Transfer solution to custom sample holder in steps
-            for _ in range(transfer_volume // 20):  # Divide into 20 µL cycles
-                pipette.aspirate(20, aluminum_block.columns()[col_idx][0])
-                pipette.dispense(20, microwell_holder.columns()[microwell_idx][0])
-                pipette.blow_out(microwell_holder.columns()[microwell_idx][0])
+            transfer_plan = [volume for _, volume in plan_transfer([transfer_volume])]
+            for cycle, volume in enumerate(transfer_plan):  # Cycles of at most 20 µL
+                slow_aspirate(pipette, volume, aluminum_block_cols[col_idx][0])
+                pipette.dispense(volume, microwell_holder_cols[microwell_idx][0])
+                if cycle == len(transfer_plan) - 1:  # Blow out after the final cycle only
+                    pipette.blow_out(microwell_holder_cols[microwell_idx][0])
             
-            pipette.move_to(microwell_holder.columns()[microwell_idx][0].top(30))
             pipette.drop_tip()  # Drop the tip after transferring solution
 
-        # Step 3: Transfer DI water to the custom sample holder
-            pipette.pick_up_tip()
-            pipette.aspirate(20, reservoir.columns()[di_water_column][0])  # Aspirate 20 µL DI water
-            pipette.dispense(20, microwell_holder.columns()[microwell_idx][0])  # Dispense into the custom sample holder
-            pipette.move_to(microwell_holder.columns()[microwell_idx][0].top(30))
-            pipette.drop_tip()  # Drop the tip after transferring DI water
+        # Step 3: Transfer DI water to all custom sample holder columns with a single tip
+        # Dispense 1 mm above the well top so the shared tip never touches the solutions, then blow out into the same
+        # well so no hanging drop is carried to the next well or back into the DI water column
+        # (transfer() rather than distribute() - distribute() cannot blow out into the destination well)
+        pipette.pick_up_tip()
+        pipette.transfer(
+            20,
+            reservoir_cols[di_water_column][0],
+            [microwell_holder_cols[microwell_idx][0].top(1) for microwell_idx in microwell_columns],
+            new_tip='never',
+            blow_out=True,
+            blowout_location='destination well')
+        pipette.drop_tip()  # Drop the tip after transferring DI water
 
 
 #############################################################################################################################################################
 
 # PROTOCOL 
 
-# STEP 1: Aspirate and dispense materials into 96-well aluminum block
-
-    # Materials A, B, and C to columns 1, 2, and 3 of aluminum_block_1
-    refill_materials(pipette=p20_multi, reservoir_columns=[0, 1, 2], dest_columns=[0, 1, 2], volume_per_cycle=20, total_volume=160)
-
-
-# STEP 2: Dispense mixtures into columns 4, 5, 6 of PLATE 1 
-
-    # Column 4: 50-50 AB
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[0, 1], dest_column=3, source_volumes=[50,50], mixing_cycles = mixing_cycles)
-
-    # Column 5: 50-50 AC
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[0, 2], dest_column=4, source_volumes=[50,50], mixing_cycles = mixing_cycles)
-
-    # Column 6: 50-50 BC
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[1, 2], dest_column=5, source_volumes=[50,50], mixing_cycles= mixing_cycles)
-
-# STEP 3: Refill Columns 1, 2, 3 of PLATE 1 to 160µL
-
-    # Materials A, B, and C to columns 1, 2, and 3 of aluminum_block_1
-    refill_materials(pipette=p20_multi, reservoir_columns=[0, 1, 2], dest_columns=[0, 1, 2], volume_per_cycle=20, total_volume=100)
-
-# STEP 4: Dispense mixtures into columns 7, 8, 9, 10 of Plate 1
-
-    # Column 7: 75-25 AB
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[0, 1], dest_column=6, source_volumes=[75,25], mixing_cycles = mixing_cycles)
-
-    # Column 8: 75-25 AC
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[0, 2], dest_column=7, source_volumes=[75,25], mixing_cycles = mixing_cycles)
-
-    # Column 9: 75-25 BC
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[1, 2], dest_column=8, source_volumes=[75,25], mixing_cycles = mixing_cycles)
-
-    # Column 10: 75-25 CB
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[2, 1], dest_column=9, source_volumes=[75,25], mixing_cycles = mixing_cycles)
-
-# STEP 5: Refill Column 1 to 130µL and Columns 2, 3 to 155µL
-
-    # Materials A, B, and C to columns 1, 2, and 3 of aluminum_block_1
-    refill_materials(pipette=p20_multi, reservoir_columns=[0, 1, 2], dest_columns=[0, 1, 2], volume_per_cycle=20, total_volume=120)
-
-# STEP 6: Dispense mixtures into columns 11, 12 of Plate 1
-
-    # Column 11: 75-25 CA
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[2, 0], dest_column=10, source_volumes=[75,25], mixing_cycles = mixing_cycles)
-
-    # Column 12: 75-25 BA
-    transfer_and_mix_once(pipette=p20_multi, source_columns=[1, 0], dest_column=11, source_volumes=[75,25], mixing_cycles = mixing_cycles)
+# STEPS 1-6: Fill the aluminum block and dispense mixtures by interpreting the RECIPES table
+
+    last_liquid_well = None  # Aluminum block column whose material alone is carried by the tip still on the pipette
+    for i, recipe in enumerate(RECIPES):
+        if recipe[0] == 'REFILL':
+            # Refill the next mixture's first source column last so its tip can be reused for that mixture
+            next_source = None
+            if i + 1 < len(RECIPES) and RECIPES[i + 1][0] != 'REFILL':
+                next_source = RECIPES[i + 1][0][0]
+            refill_columns = [column for column in [0, 1, 2] if column != next_source]
+            if next_source is not None:
+                refill_columns.append(next_source)
+
+            # Materials A, B, and C to columns 1, 2, and 3 of aluminum_block_1
+            refill_materials(pipette=p20_multi, reservoir_columns=refill_columns, dest_columns=refill_columns, volume_per_cycle=20, total_volume=recipe[1],
+                             keep_last_tip=next_source is not None)
+            last_liquid_well = next_source
+        else:
+            source_columns, dest_column, source_volumes = recipe
+            transfer_and_mix_once(pipette=p20_multi, source_columns=source_columns, dest_column=dest_column, source_volumes=source_volumes, mixing_cycles = mixing_cycles,
+                                  tip_attached=last_liquid_well == source_columns[0])
+            last_liquid_well = None
 
 
 # STEP 7: Pause for Temperature Equilibration
@@ -267,6 +339,8 @@ def run(protocol: protocol_api.ProtocolContext):
     protocol.comment("Protocol will be paused for 10 minutes to allow for temperature equilibration")
 
     # Delay the protocol for 10 minutes
+    # No pipetting is interleaved here or in the 30-minute incubations - every remaining step uses the equilibrated
+    # solutions, and the deck must stay still while the user swaps the custom microwells
     protocol.delay(minutes=10)  # Automatically pause operations for 10 minutes
 
     # Pause for manual intervention
@@ -277,9 +351,9 @@ def run(protocol: protocol_api.ProtocolContext):
 
     final_mixing_and_transfer(
     pipette=p20_multi,
-    aluminum_block=aluminum_block_1,
-    microwell_holder=custom_microwell_slot2,
-    reservoir=custom_reservoir,
+    aluminum_block_cols=ab_cols,
+    microwell_holder_cols=mw_cols,
+    reservoir_cols=res_cols,
     di_water_column=3,
     column_range=range(0, 4),  # Aluminum block columns 1–4
     mix_cycles=5,
@@ -309,9 +383,9 @@ def run(protocol: protocol_api.ProtocolContext):
 
     final_mixing_and_transfer(
     pipette=p20_multi,
-    aluminum_block=aluminum_block_1,
-    microwell_holder=custom_microwell_slot2,
-    reservoir=custom_reservoir,
+    aluminum_block_cols=ab_cols,
+    microwell_holder_cols=mw_cols,
+    reservoir_cols=res_cols,
     di_water_column=3,
     column_range=range(4, 8),  # Aluminum block columns 4–8
     mix_cycles=5,
@@ -341,9 +415,9 @@ def run(protocol: protocol_api.ProtocolContext):
 
     final_mixing_and_transfer(
     pipette=p20_multi,
-    aluminum_block=aluminum_block_1,
-    microwell_holder=custom_microwell_slot2,
-    reservoir=custom_reservoir,
+    aluminum_block_cols=ab_cols,
+    microwell_holder_cols=mw_cols,
+    reservoir_cols=res_cols,
     di_water_column=3,
     column_range=range(8, 12),  # Aluminum block columns 8–12
     mix_cycles=5,
@@ -365,3 +439,13 @@ def run(protocol: protocol_api.ProtocolContext):
 
 # End of protocol message
     protocol.comment("Protocol complete. All temperature modules have been deactivated. You may now safely remove labware and power down the robot. Thank you for using this protocol.")
+
+
+# Local simulation - run `python PBL_Opentrons_Protocol_100_50.50_75.25.py` to count protocol commands before uploading
+if __name__ == '__main__':
+    import os
+    from opentrons.simulate import simulate
+
+    with open(__file__) as protocol_file:
+        runlog, _ = simulate(protocol_file, file_name=os.path.basename(__file__), custom_labware_paths=[os.path.dirname(os.path.abspath(__file__))])
+    print(f'commands: {len(runlog)}')